@@ -2,6 +2,7 @@ import json
 import logging
 
 import borgmatic.actions.arguments
+import borgmatic.borg.environment
 import borgmatic.borg.info
 import borgmatic.borg.rlist
 import borgmatic.config.validate
@@ -30,6 +31,7 @@ def run_info(
             logger.answer(
                 f'{repository.get("label", repository["path"])}: Displaying archive summary information'
             )
+        borg_environment = borgmatic.borg.environment.make_environment(config)
         archive_name = borgmatic.borg.rlist.resolve_archive_name(
             repository['path'],
             info_arguments.archive,
@@ -38,6 +40,7 @@ def run_info(
             global_arguments,
             local_path,
             remote_path,
+            borg_environment,
         )
         json_output = borgmatic.borg.info.display_archives_info(
             repository['path'],
@@ -47,6 +50,7 @@ def run_info(
             global_arguments,
             local_path,
             remote_path,
+            borg_environment,
         )
         if json_output:  # pragma: nocover
             yield json.loads(json_output)
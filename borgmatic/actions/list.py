@@ -2,6 +2,7 @@ import json
 import logging
 
 import borgmatic.actions.arguments
+import borgmatic.borg.environment
 import borgmatic.borg.list
 import borgmatic.config.validate
 
@@ -31,6 +32,7 @@ def run_list(
             elif not list_arguments.archive:
                 logger.answer(f'{repository.get("label", repository["path"])}: Listing archives')
 
+        borg_environment = borgmatic.borg.environment.make_environment(config)
         archive_name = borgmatic.borg.rlist.resolve_archive_name(
             repository['path'],
             list_arguments.archive,
@@ -39,6 +41,7 @@ def run_list(
             global_arguments,
             local_path,
             remote_path,
+            borg_environment,
         )
         json_output = borgmatic.borg.list.list_archive(
             repository['path'],
@@ -48,6 +51,7 @@ def run_list(
             global_arguments,
             local_path,
             remote_path,
+            borg_environment,
         )
         if json_output:  # pragma: nocover
             yield json.loads(json_output)
@@ -1,6 +1,7 @@
 import json
 import logging
 
+import borgmatic.borg.environment
 import borgmatic.borg.rlist
 import borgmatic.config.validate
 
@@ -35,6 +36,7 @@ def run_rlist(
             global_arguments=global_arguments,
             local_path=local_path,
             remote_path=remote_path,
+            borg_environment=borgmatic.borg.environment.make_environment(config),
         )
         if json_output:  # pragma: nocover
             yield json.loads(json_output)
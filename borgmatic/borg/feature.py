@@ -1,3 +1,4 @@
+import functools
 from enum import Enum
 
 from packaging.version import parse
@@ -32,9 +33,11 @@ FEATURE_TO_MINIMUM_BORG_VERSION = {
 }
 
 
+@functools.lru_cache(maxsize=64)
 def available(feature, borg_version):
     '''
     Given a Borg Feature constant and a Borg version string, return whether that feature is
-    available in that version of Borg.
+    available in that version of Borg. Results are cached, as the answer for a given feature and
+    version never changes.
     '''
     return FEATURE_TO_MINIMUM_BORG_VERSION[feature] <= parse(borg_version)
@@ -26,8 +26,8 @@ def make_flags(name, value):
 def make_flags_from_arguments(arguments, excludes=()):
     '''
     Given borgmatic command-line arguments as an instance of argparse.Namespace, and optionally a
-    list of named arguments to exclude, generate and return the corresponding Borg command-line
-    flags as a tuple.
+    collection of named arguments to exclude (ideally a set, as it's checked once per argument),
+    generate and return the corresponding Borg command-line flags as a tuple.
     '''
     return tuple(
         itertools.chain.from_iterable(
@@ -69,14 +69,19 @@ def display_archives_info(
     global_arguments,
     local_path='borg',
     remote_path=None,
+    borg_environment=None,
 ):
     '''
     Given a local or remote repository path, a configuration dict, the local Borg version, the
-    arguments to the info action as an argparse.Namespace, and global arguments, display summary
-    information for Borg archives in the repository or return JSON summary information.
+    arguments to the info action as an argparse.Namespace, global arguments, local and remote Borg
+    paths, and an optional Borg environment dict already made from the configuration, display
+    summary information for Borg archives in the repository or return JSON summary information.
     '''
     borgmatic.logger.add_custom_log_levels()
 
+    if borg_environment is None:
+        borg_environment = environment.make_environment(config)
+
     main_command = make_info_command(
         repository_path,
         config,
@@ -98,7 +103,7 @@ def display_archives_info(
 
     json_info = execute_command_and_capture_output(
         json_command,
-        extra_environment=environment.make_environment(config),
+        extra_environment=borg_environment,
         borg_local_path=local_path,
     )
 
@@ -111,5 +116,5 @@ def display_archives_info(
         main_command,
         output_log_level=logging.ANSWER,
         borg_local_path=local_path,
-        extra_environment=environment.make_environment(config),
+        extra_environment=borg_environment,
     )
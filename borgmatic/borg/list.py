@@ -11,12 +11,15 @@ logger = logging.getLogger(__name__)
 
 
 ARCHIVE_FILTER_FLAGS_MOVED_TO_RLIST = ('prefix', 'match_archives', 'sort_by', 'first', 'last')
-MAKE_FLAGS_EXCLUDES = (
-    'repository',
-    'archive',
-    'paths',
-    'find_paths',
-) + ARCHIVE_FILTER_FLAGS_MOVED_TO_RLIST
+MAKE_FLAGS_EXCLUDES = frozenset(
+    (
+        'repository',
+        'archive',
+        'paths',
+        'find_paths',
+    )
+    + ARCHIVE_FILTER_FLAGS_MOVED_TO_RLIST
+)
 
 
 def make_list_command(
@@ -138,14 +141,16 @@ def list_archive(
     global_arguments,
     local_path='borg',
     remote_path=None,
+    borg_environment=None,
 ):
     '''
     Given a local or remote repository path, a configuration dict, the local Borg version, global
     arguments as an argparse.Namespace, the arguments to the list action as an argparse.Namespace,
-    and local and remote Borg paths, display the output of listing the files of a Borg archive (or
-    return JSON output). If list_arguments.find_paths are given, list the files by searching across
-    multiple archives. If neither find_paths nor archive name are given, instead list the archives
-    in the given repository.
+    local and remote Borg paths, and an optional Borg environment dict already made from the
+    configuration, display the output of listing the files of a Borg archive (or return JSON
+    output). If list_arguments.find_paths are given, list the files by searching across multiple
+    archives. If neither find_paths nor archive name are given, instead list the archives in the
+    given repository.
     '''
     borgmatic.logger.add_custom_log_levels()
 
@@ -174,6 +179,7 @@ def list_archive(
             global_arguments,
             local_path,
             remote_path,
+            borg_environment,
         )
 
     if list_arguments.archive:
@@ -188,7 +194,8 @@ def list_archive(
             'The --json flag on the list action is not supported when using the --archive/--find flags.'
         )
 
-    borg_environment = environment.make_environment(config)
+    if borg_environment is None:
+        borg_environment = environment.make_environment(config)
 
     # If there are any paths to find (and there's not a single archive already selected), start by
     # getting a list of archives to search.
@@ -1,5 +1,8 @@
 import argparse
+import concurrent.futures
+import functools
 import logging
+import sys
 
 import borgmatic.logger
 from borgmatic.borg import environment, feature, flags
@@ -8,6 +11,64 @@ from borgmatic.execute import execute_command, execute_command_and_capture_outpu
 logger = logging.getLogger(__name__)
 
 
+INFO_FLAGS = ('--info',)
+DEBUG_FLAGS = ('--debug', '--show-rc')
+LATEST_ARCHIVE_FLAGS = ('--last', '1', '--short')
+PASSPHRASE_ENVIRONMENT_VARIABLES = frozenset(('BORG_PASSPHRASE', 'BORG_PASSCOMMAND'))
+
+
+def get_rlist_subcommand(local_borg_version):
+    '''
+    Given the local Borg version, return the name of the Borg subcommand for listing archives in a
+    repository: "rlist" for Borg 2.x and "list" for older versions.
+    '''
+    return 'rlist' if feature.available(feature.Feature.RLIST, local_borg_version) else 'list'
+
+
+@functools.lru_cache(maxsize=128)
+def _fetch_latest_archive(
+    repository_path,
+    lock_wait,
+    log_json,
+    local_borg_version,
+    local_path,
+    remote_path,
+    environment_items,
+):
+    '''
+    Given a local or remote repository path, a lock wait value, whether to log JSON, the local Borg
+    version, a local Borg path, a remote Borg path, and Borg environment variables as a tuple of
+    (name, value) pairs, introspect the repository for its latest archive and return its name.
+
+    The result is cached for the lifetime of the process, as running Borg again for the same
+    repository would yield the same archive. So tests need to call
+    _fetch_latest_archive.cache_clear() to avoid seeing results from prior tests.
+
+    Raise ValueError if there are no archives in the repository.
+    '''
+    full_command = [
+        local_path,
+        get_rlist_subcommand(local_borg_version),
+    ]
+    full_command.extend(flags.make_flags('remote-path', remote_path))
+    full_command.extend(flags.make_flags('log-json', log_json))
+    full_command.extend(flags.make_flags('lock-wait', lock_wait))
+    full_command.extend(LATEST_ARCHIVE_FLAGS)
+    full_command.extend(flags.make_repository_flags(repository_path, local_borg_version))
+
+    output = execute_command_and_capture_output(
+        tuple(full_command),
+        extra_environment=dict(environment_items) if environment_items else None,
+        borg_local_path=local_path,
+    )
+    latest_archive = output.rstrip().rpartition('\n')[2].strip()
+
+    if not latest_archive:
+        raise ValueError('No archives found in the repository')
+
+    return latest_archive
+
+
 def resolve_archive_name(
     repository_path,
     archive,
@@ -16,47 +77,92 @@ def resolve_archive_name(
     global_arguments,
     local_path='borg',
     remote_path=None,
+    borg_environment=None,
 ):
     '''
     Given a local or remote repository path, an archive name, a configuration dict, the local Borg
-    version, global arguments as an argparse.Namespace, a local Borg path, and a remote Borg path,
-    return the archive name. But if the archive name is "latest", then instead introspect the
-    repository for the latest archive and return its name.
+    version, global arguments as an argparse.Namespace, a local Borg path, a remote Borg path, and
+    an optional Borg environment dict already made from the configuration, return the archive name.
+    But if the archive name is "latest", then instead introspect the repository for the latest
+    archive and return its name.
 
     Raise ValueError if "latest" is given but there are no archives in the repository.
     '''
     if archive != 'latest':
         return archive
 
-    full_command = (
-        (
-            local_path,
-            'rlist' if feature.available(feature.Feature.RLIST, local_borg_version) else 'list',
-        )
-        + flags.make_flags('remote-path', remote_path)
-        + flags.make_flags('log-json', global_arguments.log_json)
-        + flags.make_flags('lock-wait', config.get('lock_wait'))
-        + flags.make_flags('last', 1)
-        + ('--short',)
-        + flags.make_repository_flags(repository_path, local_borg_version)
-    )
+    if borg_environment is None:
+        borg_environment = environment.make_environment(config)
 
-    output = execute_command_and_capture_output(
-        full_command,
-        extra_environment=environment.make_environment(config),
-        borg_local_path=local_path,
+    latest_archive = _fetch_latest_archive(
+        repository_path,
+        config.get('lock_wait'),
+        global_arguments.log_json,
+        local_borg_version,
+        local_path,
+        remote_path,
+        tuple(sorted(borg_environment.items())) if borg_environment else None,
     )
-    try:
-        latest_archive = output.strip().splitlines()[-1]
-    except IndexError:
-        raise ValueError('No archives found in the repository')
 
     logger.debug(f'{repository_path}: Latest archive is {latest_archive}')
 
     return latest_archive
 
 
-MAKE_FLAGS_EXCLUDES = ('repository', 'prefix', 'match_archives')
+def resolve_archive_names(
+    repository_paths,
+    archive,
+    config,
+    local_borg_version,
+    global_arguments,
+    local_path='borg',
+    remote_path=None,
+    borg_environment=None,
+    jobs=None,
+):
+    '''
+    Given a sequence of local or remote repository paths, an archive name, a configuration dict, the
+    local Borg version, global arguments as an argparse.Namespace, a local Borg path, a remote Borg
+    path, an optional Borg environment dict already made from the configuration, and an optional
+    maximum number of concurrent jobs, return a dict from repository path to resolved archive name
+    as per resolve_archive_name().
+
+    Because resolving "latest" requires running Borg once per repository, do so concurrently across
+    repositories, but only when Borg can't prompt for a passphrase: The Borg environment supplies
+    one and stdin isn't a TTY. Otherwise, concurrent Borg processes could prompt on the same
+    terminal at once, so resolve serially instead.
+
+    Raise ValueError if "latest" is given but there are no archives in any one of the repositories.
+    '''
+    repository_paths = tuple(repository_paths)
+
+    if archive != 'latest' or not repository_paths:
+        return {repository_path: archive for repository_path in repository_paths}
+
+    if borg_environment is None:
+        borg_environment = environment.make_environment(config)
+
+    resolve = functools.partial(
+        resolve_archive_name,
+        archive=archive,
+        config=config,
+        local_borg_version=local_borg_version,
+        global_arguments=global_arguments,
+        local_path=local_path,
+        remote_path=remote_path,
+        borg_environment=borg_environment,
+    )
+
+    if sys.stdin.isatty() or not PASSPHRASE_ENVIRONMENT_VARIABLES.intersection(borg_environment):
+        return {repository_path: resolve(repository_path) for repository_path in repository_paths}
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=jobs or min(8, len(repository_paths))
+    ) as executor:
+        return dict(zip(repository_paths, executor.map(resolve, repository_paths)))
+
+
+MAKE_FLAGS_EXCLUDES = frozenset(('repository', 'prefix', 'match_archives'))
 
 
 def make_rlist_command(
@@ -73,42 +179,41 @@ def make_rlist_command(
     arguments to the rlist action, global arguments as an argparse.Namespace instance, and local and
     remote Borg paths, return a command as a tuple to list archives with a repository.
     '''
-    return (
-        (
-            local_path,
-            'rlist' if feature.available(feature.Feature.RLIST, local_borg_version) else 'list',
-        )
-        + (
-            ('--info',)
-            if logger.getEffectiveLevel() == logging.INFO and not rlist_arguments.json
-            else ()
-        )
-        + (
-            ('--debug', '--show-rc')
-            if logger.isEnabledFor(logging.DEBUG) and not rlist_arguments.json
-            else ()
-        )
-        + flags.make_flags('remote-path', remote_path)
-        + flags.make_flags('log-json', global_arguments.log_json)
-        + flags.make_flags('lock-wait', config.get('lock_wait'))
-        + (
-            (
-                flags.make_flags('match-archives', f'sh:{rlist_arguments.prefix}*')
-                if feature.available(feature.Feature.MATCH_ARCHIVES, local_borg_version)
-                else flags.make_flags('glob-archives', f'{rlist_arguments.prefix}*')
-            )
-            if rlist_arguments.prefix
-            else (
-                flags.make_match_archives_flags(
-                    rlist_arguments.match_archives or config.get('match_archives'),
-                    config.get('archive_name_format'),
-                    local_borg_version,
-                )
+    command = [
+        local_path,
+        get_rlist_subcommand(local_borg_version),
+    ]
+
+    if not rlist_arguments.json:
+        log_level = logger.getEffectiveLevel()
+
+        if log_level == logging.INFO:
+            command.extend(INFO_FLAGS)
+        if log_level <= logging.DEBUG:
+            command.extend(DEBUG_FLAGS)
+
+    command.extend(flags.make_flags('remote-path', remote_path))
+    command.extend(flags.make_flags('log-json', global_arguments.log_json))
+    command.extend(flags.make_flags('lock-wait', config.get('lock_wait')))
+
+    if rlist_arguments.prefix:
+        if feature.available(feature.Feature.MATCH_ARCHIVES, local_borg_version):
+            command.extend(flags.make_flags('match-archives', 'sh:' + rlist_arguments.prefix + '*'))
+        else:
+            command.extend(flags.make_flags('glob-archives', rlist_arguments.prefix + '*'))
+    else:
+        command.extend(
+            flags.make_match_archives_flags(
+                rlist_arguments.match_archives or config.get('match_archives'),
+                config.get('archive_name_format'),
+                local_borg_version,
             )
         )
-        + flags.make_flags_from_arguments(rlist_arguments, excludes=MAKE_FLAGS_EXCLUDES)
-        + flags.make_repository_flags(repository_path, local_borg_version)
-    )
+
+    command.extend(flags.make_flags_from_arguments(rlist_arguments, excludes=MAKE_FLAGS_EXCLUDES))
+    command.extend(flags.make_repository_flags(repository_path, local_borg_version))
+
+    return tuple(command)
 
 
 def list_repository(
@@ -119,15 +224,18 @@ def list_repository(
     global_arguments,
     local_path='borg',
     remote_path=None,
+    borg_environment=None,
 ):
     '''
     Given a local or remote repository path, a configuration dict, the local Borg version, the
-    arguments to the list action, global arguments as an argparse.Namespace instance, and local and
-    remote Borg paths, display the output of listing Borg archives in the given repository (or
-    return JSON output).
+    arguments to the list action, global arguments as an argparse.Namespace instance, local and
+    remote Borg paths, and an optional Borg environment dict already made from the configuration,
+    display the output of listing Borg archives in the given repository (or return JSON output).
     '''
     borgmatic.logger.add_custom_log_levels()
-    borg_environment = environment.make_environment(config)
+
+    if borg_environment is None:
+        borg_environment = environment.make_environment(config)
 
     main_command = make_rlist_command(
         repository_path,
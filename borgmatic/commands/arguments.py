@@ -1,5 +1,4 @@
 import collections
-import itertools
 import sys
 from argparse import ArgumentParser
 
@@ -26,6 +25,9 @@ ACTION_ALIASES = {
     'key': [],
     'borg': [],
 }
+ALIAS_TO_ACTION_NAME = {
+    alias: action_name for action_name, aliases in ACTION_ALIASES.items() for alias in aliases
+}
 
 
 def get_subaction_parsers(action_parser):
@@ -121,12 +123,14 @@ def get_unparsable_arguments(remaining_action_arguments):
     if not remaining_action_arguments:
         return ()
 
+    # An argument can only be unparsable if it remains for every action parser, so intersect sets
+    # of remaining arguments rather than scanning each tuple per argument. Then take the order from
+    # the first tuple.
+    first_arguments, *other_arguments = remaining_action_arguments
+    unparsable_arguments = set(first_arguments).intersection(*other_arguments)
+
     return tuple(
-        argument
-        for argument in dict.fromkeys(
-            itertools.chain.from_iterable(remaining_action_arguments)
-        ).keys()
-        if all(argument in action_arguments for action_arguments in remaining_action_arguments)
+        argument for argument in dict.fromkeys(first_arguments) if argument in unparsable_arguments
     )
 
 
@@ -144,19 +148,18 @@ def parse_arguments_for_actions(unparsed_arguments, action_parsers, global_parse
     arguments = collections.OrderedDict()
     help_requested = bool('--help' in unparsed_arguments or '-h' in unparsed_arguments)
     remaining_action_arguments = []
-    alias_to_action_name = {
-        alias: action_name for action_name, aliases in ACTION_ALIASES.items() for alias in aliases
-    }
 
     # If the "borg" action is used, skip all other action parsers. This avoids confusion like
     # "borg list" triggering borgmatic's own list action.
     if 'borg' in unparsed_arguments:
         action_parsers = {'borg': action_parsers['borg']}
 
-    # Ask each action parser, one by one, to parse arguments.
-    for argument in unparsed_arguments:
+    # Ask each action parser, one by one, to parse arguments. Only actions actually present on the
+    # command-line get parsed, and each only once (in order of first appearance), even if its name
+    # occurs multiple times.
+    for argument in dict.fromkeys(unparsed_arguments):
         action_name = argument
-        canonical_name = alias_to_action_name.get(action_name, action_name)
+        canonical_name = ALIAS_TO_ACTION_NAME.get(action_name, action_name)
         action_parser = action_parsers.get(action_name)
 
         if not action_parser:
@@ -169,6 +172,10 @@ def parse_arguments_for_actions(unparsed_arguments, action_parsers, global_parse
             subactions_parsed = False
 
             for subaction_name, subaction_parser in subaction_parsers.items():
+                # Skip subactions that weren't requested rather than bothering to parse for them.
+                if subaction_name not in unparsed_arguments:
+                    continue
+
                 remaining_action_arguments.append(
                     tuple(
                         argument
@@ -34,6 +34,7 @@ import borgmatic.actions.restore
 import borgmatic.actions.rinfo
 import borgmatic.actions.rlist
 import borgmatic.actions.transfer
+import borgmatic.borg.rlist
 import borgmatic.commands.completion.bash
 import borgmatic.commands.completion.fish
 from borgmatic.borg import umount as borg_umount
@@ -139,6 +140,10 @@ def run_configuration(config_filename, config, arguments):
                     repository=repository,
                 )
             except (OSError, CalledProcessError, ValueError) as error:
+                # A failed action may have added or removed archives before erroring, so forget
+                # any "latest" archive resolved prior to it.
+                borgmatic.borg.rlist._fetch_latest_archive.cache_clear()
+
                 if retry_num < retries:
                     repo_queue.put(
                         (repository, retry_num + 1),
@@ -248,6 +253,11 @@ def run_configuration(config_filename, config, arguments):
             yield from log_error_records(f'{config_filename}: Error running on-error hook', error)
 
 
+# Actions that can add or remove archives. This includes check, because "check --repair" can
+# delete archives.
+ARCHIVE_MODIFYING_ACTIONS = {'rcreate', 'transfer', 'create', 'prune', 'check', 'borg'}
+
+
 def run_actions(
     *,
     arguments,
@@ -477,6 +487,11 @@ def run_actions(
                 remote_path,
             )
 
+        # Any "latest" archive resolved prior to an action that adds or removes archives may now
+        # be stale.
+        if action_name in ARCHIVE_MODIFYING_ACTIONS:
+            borgmatic.borg.rlist._fetch_latest_archive.cache_clear()
+
     command.execute_hook(
         config.get('after_actions'),
         config.get('umask'),
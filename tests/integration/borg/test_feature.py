@@ -15,3 +15,11 @@ def test_available_true_for_borg_stable_version_introducing_feature():
 
 def test_available_false_for_too_old_borg_version():
     assert not module.available(module.Feature.COMPACT, '1.1.5')
+
+
+def test_available_caches_result_for_same_feature_and_version():
+    module.available.cache_clear()
+
+    assert module.available(module.Feature.COMPACT, '1.3.7')
+    assert module.available(module.Feature.COMPACT, '1.3.7')
+    assert module.available.cache_info().hits == 1
@@ -635,3 +635,9 @@ def test_parse_arguments_with_borg_action_and_no_dry_run_does_not_raise():
     flexmock(module.collect).should_receive('get_default_config_paths').and_return(['default'])
 
     module.parse_arguments('borg', 'list')
+
+
+def test_alias_to_action_name_maps_every_action_alias_to_its_action():
+    for action_name, aliases in module.ACTION_ALIASES.items():
+        for alias in aliases:
+            assert module.ALIAS_TO_ACTION_NAME[alias] == action_name
@@ -26,3 +26,36 @@ def test_run_info_does_not_raise():
             remote_path=None,
         )
     )
+
+
+def test_run_info_passes_one_borg_environment_to_archive_resolution_and_info():
+    flexmock(module.logger).answer = lambda message: None
+    flexmock(module.borgmatic.config.validate).should_receive('repositories_match').and_return(True)
+    borg_environment = {'BORG_PASSPHRASE': 'secret'}
+    flexmock(module.borgmatic.borg.environment).should_receive('make_environment').with_args(
+        {}
+    ).and_return(borg_environment).once()
+    global_arguments = flexmock(log_json=False)
+    flexmock(module.borgmatic.borg.rlist).should_receive('resolve_archive_name').with_args(
+        'repo', 'latest', {}, '1.2.3', global_arguments, 'borg', None, borg_environment
+    ).and_return('archive')
+    updated_arguments = flexmock()
+    flexmock(module.borgmatic.actions.arguments).should_receive('update_arguments').and_return(
+        updated_arguments
+    )
+    flexmock(module.borgmatic.borg.info).should_receive('display_archives_info').with_args(
+        'repo', {}, '1.2.3', updated_arguments, global_arguments, 'borg', None, borg_environment
+    ).once()
+    info_arguments = flexmock(repository=flexmock(), archive='latest', json=False)
+
+    list(
+        module.run_info(
+            repository={'path': 'repo'},
+            config={},
+            local_borg_version='1.2.3',
+            info_arguments=info_arguments,
+            global_arguments=global_arguments,
+            local_path='borg',
+            remote_path=None,
+        )
+    )
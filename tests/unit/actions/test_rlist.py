@@ -20,3 +20,36 @@ def test_run_rlist_does_not_raise():
             remote_path=None,
         )
     )
+
+
+def test_run_rlist_passes_borg_environment_to_list_repository():
+    flexmock(module.logger).answer = lambda message: None
+    flexmock(module.borgmatic.config.validate).should_receive('repositories_match').and_return(True)
+    borg_environment = {'BORG_PASSPHRASE': 'secret'}
+    flexmock(module.borgmatic.borg.environment).should_receive('make_environment').with_args(
+        {}
+    ).and_return(borg_environment).once()
+    rlist_arguments = flexmock(repository=flexmock(), json=False)
+    global_arguments = flexmock()
+    flexmock(module.borgmatic.borg.rlist).should_receive('list_repository').with_args(
+        'repo',
+        {},
+        '1.2.3',
+        rlist_arguments=rlist_arguments,
+        global_arguments=global_arguments,
+        local_path='borg',
+        remote_path=None,
+        borg_environment=borg_environment,
+    ).once()
+
+    list(
+        module.run_rlist(
+            repository={'path': 'repo'},
+            config={},
+            local_borg_version='1.2.3',
+            rlist_arguments=rlist_arguments,
+            global_arguments=global_arguments,
+            local_path='borg',
+            remote_path=None,
+        )
+    )
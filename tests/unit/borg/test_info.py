@@ -1,3 +1,4 @@
+import argparse
 import logging
 
 import pytest
@@ -8,7 +9,12 @@ from borgmatic.borg import info as module
 from ..test_verbosity import insert_logging_mock
 
 
-def test_make_info_command_constructs_borg_info_command():
+@pytest.fixture
+def info_arguments():
+    return argparse.Namespace(archive=None, json=False, prefix=None, match_archives=None)
+
+
+def test_make_info_command_constructs_borg_info_command(info_arguments):
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_match_archives_flags').with_args(
         None, None, '2.3.4'
@@ -20,8 +26,8 @@ def test_make_info_command_constructs_borg_info_command():
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=False, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
         local_path='borg',
         remote_path=None,
     )
@@ -29,7 +35,7 @@ def test_make_info_command_constructs_borg_info_command():
     assert command == ('borg', 'info', '--repo', 'repo')
 
 
-def test_make_info_command_with_log_info_passes_through_to_command():
+def test_make_info_command_with_log_info_passes_through_to_command(info_arguments):
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_match_archives_flags').with_args(
         None, None, '2.3.4'
@@ -42,8 +48,8 @@ def test_make_info_command_with_log_info_passes_through_to_command():
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=False, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
         local_path='borg',
         remote_path=None,
     )
@@ -51,7 +57,8 @@ def test_make_info_command_with_log_info_passes_through_to_command():
     assert command == ('borg', 'info', '--info', '--repo', 'repo')
 
 
-def test_make_info_command_with_log_info_and_json_omits_borg_logging_flags():
+def test_make_info_command_with_log_info_and_json_omits_borg_logging_flags(info_arguments):
+    info_arguments.json = True
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_match_archives_flags').with_args(
         None, None, '2.3.4'
@@ -64,8 +71,8 @@ def test_make_info_command_with_log_info_and_json_omits_borg_logging_flags():
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=True, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
         local_path='borg',
         remote_path=None,
     )
@@ -73,7 +80,7 @@ def test_make_info_command_with_log_info_and_json_omits_borg_logging_flags():
     assert command == ('borg', 'info', '--json', '--repo', 'repo')
 
 
-def test_make_info_command_with_log_debug_passes_through_to_command():
+def test_make_info_command_with_log_debug_passes_through_to_command(info_arguments):
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_match_archives_flags').with_args(
         None, None, '2.3.4'
@@ -86,8 +93,8 @@ def test_make_info_command_with_log_debug_passes_through_to_command():
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=False, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
         local_path='borg',
         remote_path=None,
     )
@@ -95,7 +102,8 @@ def test_make_info_command_with_log_debug_passes_through_to_command():
     assert command == ('borg', 'info', '--debug', '--show-rc', '--repo', 'repo')
 
 
-def test_make_info_command_with_log_debug_and_json_omits_borg_logging_flags():
+def test_make_info_command_with_log_debug_and_json_omits_borg_logging_flags(info_arguments):
+    info_arguments.json = True
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_match_archives_flags').with_args(
         None, None, '2.3.4'
@@ -107,8 +115,8 @@ def test_make_info_command_with_log_debug_and_json_omits_borg_logging_flags():
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=True, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
         local_path='borg',
         remote_path=None,
     )
@@ -116,7 +124,8 @@ def test_make_info_command_with_log_debug_and_json_omits_borg_logging_flags():
     assert command == ('borg', 'info', '--json', '--repo', 'repo')
 
 
-def test_make_info_command_with_json_passes_through_to_command():
+def test_make_info_command_with_json_passes_through_to_command(info_arguments):
+    info_arguments.json = True
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_match_archives_flags').with_args(
         None, None, '2.3.4'
@@ -128,8 +137,8 @@ def test_make_info_command_with_json_passes_through_to_command():
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=True, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
         local_path='borg',
         remote_path=None,
     )
@@ -137,7 +146,8 @@ def test_make_info_command_with_json_passes_through_to_command():
     assert command == ('borg', 'info', '--json', '--repo', 'repo')
 
 
-def test_make_info_command_with_archive_uses_match_archives_flags():
+def test_make_info_command_with_archive_uses_match_archives_flags(info_arguments):
+    info_arguments.archive = 'archive'
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_match_archives_flags').with_args(
         'archive', None, '2.3.4'
@@ -149,8 +159,8 @@ def test_make_info_command_with_archive_uses_match_archives_flags():
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive='archive', json=False, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
         local_path='borg',
         remote_path=None,
     )
@@ -158,7 +168,7 @@ def test_make_info_command_with_archive_uses_match_archives_flags():
     assert command == ('borg', 'info', '--match-archives', 'archive', '--repo', 'repo')
 
 
-def test_make_info_command_with_local_path_passes_through_to_command():
+def test_make_info_command_with_local_path_passes_through_to_command(info_arguments):
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_match_archives_flags').with_args(
         None, None, '2.3.4'
@@ -170,8 +180,8 @@ def test_make_info_command_with_local_path_passes_through_to_command():
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=False, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
         local_path='borg1',
         remote_path=None,
     )
@@ -179,7 +189,7 @@ def test_make_info_command_with_local_path_passes_through_to_command():
     command == ('borg1', 'info', '--repo', 'repo')
 
 
-def test_make_info_command_with_remote_path_passes_through_to_command():
+def test_make_info_command_with_remote_path_passes_through_to_command(info_arguments):
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_flags').with_args(
         'remote-path', 'borg1'
@@ -194,8 +204,8 @@ def test_make_info_command_with_remote_path_passes_through_to_command():
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=False, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
         local_path='borg',
         remote_path='borg1',
     )
@@ -203,7 +213,7 @@ def test_make_info_command_with_remote_path_passes_through_to_command():
     assert command == ('borg', 'info', '--remote-path', 'borg1', '--repo', 'repo')
 
 
-def test_make_info_command_with_log_json_passes_through_to_command():
+def test_make_info_command_with_log_json_passes_through_to_command(info_arguments):
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_flags').with_args('log-json', True).and_return(
         ('--log-json',)
@@ -218,8 +228,8 @@ def test_make_info_command_with_log_json_passes_through_to_command():
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=True),
-        info_arguments=flexmock(archive=None, json=False, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=True),
+        info_arguments=info_arguments,
         local_path='borg',
         remote_path=None,
     )
@@ -227,7 +237,7 @@ def test_make_info_command_with_log_json_passes_through_to_command():
     assert command == ('borg', 'info', '--log-json', '--repo', 'repo')
 
 
-def test_make_info_command_with_lock_wait_passes_through_to_command():
+def test_make_info_command_with_lock_wait_passes_through_to_command(info_arguments):
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_flags').with_args('lock-wait', 5).and_return(
         ('--lock-wait', '5')
@@ -243,8 +253,8 @@ def test_make_info_command_with_lock_wait_passes_through_to_command():
         repository_path='repo',
         config=config,
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=False, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
         local_path='borg',
         remote_path=None,
     )
@@ -267,8 +277,8 @@ def test_make_info_command_transforms_prefix_into_match_archives_flags():
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=False, prefix='foo'),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=argparse.Namespace(archive=None, json=False, prefix='foo'),
         local_path='borg',
         remote_path=None,
     )
@@ -291,8 +301,8 @@ def test_make_info_command_prefers_prefix_over_archive_name_format():
         repository_path='repo',
         config={'archive_name_format': 'bar-{now}'},  # noqa: FS003
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=False, prefix='foo'),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=argparse.Namespace(archive=None, json=False, prefix='foo'),
         local_path='borg',
         remote_path=None,
     )
@@ -300,7 +310,7 @@ def test_make_info_command_prefers_prefix_over_archive_name_format():
     assert command == ('borg', 'info', '--match-archives', 'sh:foo*', '--repo', 'repo')
 
 
-def test_make_info_command_transforms_archive_name_format_into_match_archives_flags():
+def test_make_info_command_transforms_archive_name_format_into_match_archives_flags(info_arguments):
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_match_archives_flags').with_args(
         None, 'bar-{now}', '2.3.4'  # noqa: FS003
@@ -312,8 +322,8 @@ def test_make_info_command_transforms_archive_name_format_into_match_archives_fl
         repository_path='repo',
         config={'archive_name_format': 'bar-{now}'},  # noqa: FS003
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=False, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
         local_path='borg',
         remote_path=None,
     )
@@ -321,7 +331,7 @@ def test_make_info_command_transforms_archive_name_format_into_match_archives_fl
     assert command == ('borg', 'info', '--match-archives', 'sh:bar-*', '--repo', 'repo')
 
 
-def test_make_info_command_with_match_archives_option_passes_through_to_command():
+def test_make_info_command_with_match_archives_option_passes_through_to_command(info_arguments):
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_match_archives_flags').with_args(
         'sh:foo-*', 'bar-{now}', '2.3.4'  # noqa: FS003
@@ -337,8 +347,8 @@ def test_make_info_command_with_match_archives_option_passes_through_to_command(
             'match_archives': 'sh:foo-*',
         },
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=False, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
         local_path='borg',
         remote_path=None,
     )
@@ -346,7 +356,8 @@ def test_make_info_command_with_match_archives_option_passes_through_to_command(
     assert command == ('borg', 'info', '--match-archives', 'sh:foo-*', '--repo', 'repo')
 
 
-def test_make_info_command_with_match_archives_flag_passes_through_to_command():
+def test_make_info_command_with_match_archives_flag_passes_through_to_command(info_arguments):
+    info_arguments.match_archives = 'sh:foo-*'
     flexmock(module.flags).should_receive('make_flags').and_return(())
     flexmock(module.flags).should_receive('make_match_archives_flags').with_args(
         'sh:foo-*', 'bar-{now}', '2.3.4'  # noqa: FS003
@@ -359,8 +370,8 @@ def test_make_info_command_with_match_archives_flag_passes_through_to_command():
         repository_path='repo',
         config={'archive_name_format': 'bar-{now}'},  # noqa: FS003
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=False, prefix=None, match_archives='sh:foo-*'),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
         local_path='borg',
         remote_path=None,
     )
@@ -385,8 +396,8 @@ def test_make_info_command_passes_arguments_through_to_command(argument_name):
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=argparse.Namespace(
             archive=None, json=False, prefix=None, match_archives=None, **{argument_name: 'value'}
         ),
         local_path='borg',
@@ -405,7 +416,7 @@ def test_make_info_command_with_date_based_matching_passes_through_to_command():
         ('--newer', '1d', '--newest', '1y', '--older', '1m', '--oldest', '1w')
     )
     flexmock(module.flags).should_receive('make_repository_flags').and_return(('--repo', 'repo'))
-    info_arguments = flexmock(
+    info_arguments = argparse.Namespace(
         archive=None,
         json=False,
         prefix=None,
@@ -420,7 +431,7 @@ def test_make_info_command_with_date_based_matching_passes_through_to_command():
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
         info_arguments=info_arguments,
         local_path='borg',
         remote_path=None,
@@ -442,8 +453,9 @@ def test_make_info_command_with_date_based_matching_passes_through_to_command():
     )
 
 
-def test_display_archives_info_calls_two_commands():
+def test_display_archives_info_calls_two_commands(info_arguments):
     flexmock(module.borgmatic.logger).should_receive('add_custom_log_levels')
+    flexmock(module.logging).ANSWER = module.borgmatic.logger.ANSWER
     flexmock(module).should_receive('make_info_command')
     flexmock(module.environment).should_receive('make_environment')
     flexmock(module).should_receive('execute_command_and_capture_output').once()
@@ -454,12 +466,13 @@ def test_display_archives_info_calls_two_commands():
         repository_path='repo',
         config={},
         local_borg_version='2.3.4',
-        global_arguments=flexmock(log_json=False),
-        info_arguments=flexmock(archive=None, json=False, prefix=None, match_archives=None),
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
     )
 
 
-def test_display_archives_info_with_json_calls_json_command_only():
+def test_display_archives_info_with_json_calls_json_command_only(info_arguments):
+    info_arguments.json = True
     flexmock(module.borgmatic.logger).should_receive('add_custom_log_levels')
     flexmock(module).should_receive('make_info_command')
     flexmock(module.environment).should_receive('make_environment')
@@ -473,8 +486,35 @@ def test_display_archives_info_with_json_calls_json_command_only():
             repository_path='repo',
             config={},
             local_borg_version='2.3.4',
-            global_arguments=flexmock(log_json=False),
-            info_arguments=flexmock(archive=None, json=True, prefix=None, match_archives=None),
+            global_arguments=argparse.Namespace(log_json=False),
+            info_arguments=info_arguments,
         )
         == json_output
     )
+
+
+def test_display_archives_info_with_borg_environment_skips_making_environment(info_arguments):
+    flexmock(module.borgmatic.logger).should_receive('add_custom_log_levels')
+    flexmock(module.logging).ANSWER = module.borgmatic.logger.ANSWER
+    flexmock(module).should_receive('make_info_command')
+    flexmock(module.environment).should_receive('make_environment').never()
+    borg_environment = {'BORG_PASSPHRASE': 'secret'}
+    flexmock(module).should_receive('execute_command_and_capture_output').with_args(
+        None, extra_environment=borg_environment, borg_local_path='borg'
+    ).once()
+    flexmock(module.flags).should_receive('warn_for_aggressive_archive_flags')
+    flexmock(module).should_receive('execute_command').with_args(
+        None,
+        output_log_level=object,
+        borg_local_path='borg',
+        extra_environment=borg_environment,
+    ).once()
+
+    module.display_archives_info(
+        repository_path='repo',
+        config={},
+        local_borg_version='2.3.4',
+        global_arguments=argparse.Namespace(log_json=False),
+        info_arguments=info_arguments,
+        borg_environment=borg_environment,
+    )
@@ -344,6 +344,46 @@ def test_list_archive_calls_borg_with_flags():
     )
 
 
+def test_list_archive_with_borg_environment_skips_making_environment():
+    flexmock(module.borgmatic.logger).should_receive('add_custom_log_levels')
+    flexmock(module.logging).ANSWER = module.borgmatic.logger.ANSWER
+    flexmock(module.logger).answer = lambda message: None
+    list_arguments = argparse.Namespace(
+        archive='archive',
+        paths=None,
+        json=False,
+        find_paths=None,
+        prefix=None,
+        match_archives=None,
+        sort_by=None,
+        first=None,
+        last=None,
+    )
+    borg_environment = {'BORG_PASSPHRASE': 'secret'}
+
+    flexmock(module.feature).should_receive('available').and_return(False)
+    flexmock(module).should_receive('make_list_command').and_return(
+        ('borg', 'list', 'repo::archive')
+    )
+    flexmock(module).should_receive('make_find_paths').and_return(())
+    flexmock(module.environment).should_receive('make_environment').never()
+    flexmock(module).should_receive('execute_command').with_args(
+        ('borg', 'list', 'repo::archive'),
+        output_log_level=module.borgmatic.logger.ANSWER,
+        borg_local_path='borg',
+        extra_environment=borg_environment,
+    ).once()
+
+    module.list_archive(
+        repository_path='repo',
+        config={},
+        local_borg_version='1.2.3',
+        list_arguments=list_arguments,
+        global_arguments=flexmock(log_json=False),
+        borg_environment=borg_environment,
+    )
+
+
 def test_list_archive_with_archive_and_json_errors():
     flexmock(module.borgmatic.logger).should_receive('add_custom_log_levels')
     flexmock(module.logging).ANSWER = module.borgmatic.logger.ANSWER
@@ -521,7 +561,9 @@ def test_list_archive_without_archive_delegates_to_list_repository():
     )
 
     flexmock(module.feature).should_receive('available').and_return(False)
-    flexmock(module.rlist).should_receive('list_repository')
+    flexmock(module.rlist).should_receive('list_repository').with_args(
+        'repo', {}, '1.2.3', object, object, 'borg', None, None
+    ).once()
     flexmock(module.environment).should_receive('make_environment').never()
     flexmock(module).should_receive('execute_command').never()
 
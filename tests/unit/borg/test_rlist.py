@@ -16,6 +16,23 @@ BORG_LIST_LATEST_ARGUMENTS = (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_latest_archive_cache():
+    module._fetch_latest_archive.cache_clear()
+
+
+def test_get_rlist_subcommand_with_rlist_feature_returns_rlist():
+    flexmock(module.feature).should_receive('available').and_return(True)
+
+    assert module.get_rlist_subcommand('2.3.4') == 'rlist'
+
+
+def test_get_rlist_subcommand_without_rlist_feature_returns_list():
+    flexmock(module.feature).should_receive('available').and_return(False)
+
+    assert module.get_rlist_subcommand('1.2.3') == 'list'
+
+
 def test_resolve_archive_name_passes_through_non_latest_archive_name():
     archive = 'myhost-2030-01-01T14:41:17.647620'
 
@@ -25,7 +42,7 @@ def test_resolve_archive_name_passes_through_non_latest_archive_name():
             archive,
             config={},
             local_borg_version='1.2.3',
-            global_arguments=flexmock(log_json=False),
+            global_arguments=argparse.Namespace(log_json=False),
         )
         == archive
     )
@@ -46,7 +63,7 @@ def test_resolve_archive_name_calls_borg_with_flags():
             'latest',
             config={},
             local_borg_version='1.2.3',
-            global_arguments=flexmock(log_json=False),
+            global_arguments=argparse.Namespace(log_json=False),
         )
         == expected_archive
     )
@@ -68,7 +85,7 @@ def test_resolve_archive_name_with_log_info_calls_borg_without_info_flag():
             'latest',
             config={},
             local_borg_version='1.2.3',
-            global_arguments=flexmock(log_json=False),
+            global_arguments=argparse.Namespace(log_json=False),
         )
         == expected_archive
     )
@@ -90,7 +107,7 @@ def test_resolve_archive_name_with_log_debug_calls_borg_without_debug_flag():
             'latest',
             config={},
             local_borg_version='1.2.3',
-            global_arguments=flexmock(log_json=False),
+            global_arguments=argparse.Namespace(log_json=False),
         )
         == expected_archive
     )
@@ -111,7 +128,7 @@ def test_resolve_archive_name_with_local_path_calls_borg_via_local_path():
             'latest',
             config={},
             local_borg_version='1.2.3',
-            global_arguments=flexmock(log_json=False),
+            global_arguments=argparse.Namespace(log_json=False),
             local_path='borg1',
         )
         == expected_archive
@@ -133,13 +150,34 @@ def test_resolve_archive_name_with_remote_path_calls_borg_with_remote_path_flags
             'latest',
             config={},
             local_borg_version='1.2.3',
-            global_arguments=flexmock(log_json=False),
+            global_arguments=argparse.Namespace(log_json=False),
             remote_path='borg1',
         )
         == expected_archive
     )
 
 
+def test_resolve_archive_name_with_multiple_output_lines_returns_last_line():
+    expected_archive = 'archive-name'
+    flexmock(module.environment).should_receive('make_environment')
+    flexmock(module).should_receive('execute_command_and_capture_output').with_args(
+        ('borg', 'list') + BORG_LIST_LATEST_ARGUMENTS,
+        extra_environment=None,
+        borg_local_path='borg',
+    ).and_return('Some warning\n' + expected_archive + '\n\n')
+
+    assert (
+        module.resolve_archive_name(
+            'repo',
+            'latest',
+            config={},
+            local_borg_version='1.2.3',
+            global_arguments=argparse.Namespace(log_json=False),
+        )
+        == expected_archive
+    )
+
+
 def test_resolve_archive_name_without_archives_raises():
     flexmock(module.environment).should_receive('make_environment')
     flexmock(module).should_receive('execute_command_and_capture_output').with_args(
@@ -154,7 +192,7 @@ def test_resolve_archive_name_without_archives_raises():
             'latest',
             config={},
             local_borg_version='1.2.3',
-            global_arguments=flexmock(log_json=False),
+            global_arguments=argparse.Namespace(log_json=False),
         )
 
 
@@ -174,7 +212,7 @@ def test_resolve_archive_name_with_log_json_calls_borg_with_log_json_flags():
             'latest',
             config={},
             local_borg_version='1.2.3',
-            global_arguments=flexmock(log_json=True),
+            global_arguments=argparse.Namespace(log_json=True),
         )
         == expected_archive
     )
@@ -196,12 +234,233 @@ def test_resolve_archive_name_with_lock_wait_calls_borg_with_lock_wait_flags():
             'latest',
             config={'lock_wait': 'okay'},
             local_borg_version='1.2.3',
-            global_arguments=flexmock(log_json=False),
+            global_arguments=argparse.Namespace(log_json=False),
         )
         == expected_archive
     )
 
 
+def test_resolve_archive_name_with_repeated_call_calls_borg_only_once():
+    expected_archive = 'archive-name'
+    flexmock(module.environment).should_receive('make_environment')
+    flexmock(module).should_receive('execute_command_and_capture_output').with_args(
+        ('borg', 'list') + BORG_LIST_LATEST_ARGUMENTS,
+        extra_environment=None,
+        borg_local_path='borg',
+    ).and_return(expected_archive + '\n').once()
+
+    for _ in range(2):
+        assert (
+            module.resolve_archive_name(
+                'repo',
+                'latest',
+                config={},
+                local_borg_version='1.2.3',
+                global_arguments=argparse.Namespace(log_json=False),
+            )
+            == expected_archive
+        )
+
+
+def test_resolve_archive_name_with_borg_environment_calls_borg_with_environment():
+    expected_archive = 'archive-name'
+    flexmock(module.environment).should_receive('make_environment').and_return(
+        {'BORG_PASSPHRASE': 'secret'}
+    )
+    flexmock(module).should_receive('execute_command_and_capture_output').with_args(
+        ('borg', 'list') + BORG_LIST_LATEST_ARGUMENTS,
+        extra_environment={'BORG_PASSPHRASE': 'secret'},
+        borg_local_path='borg',
+    ).and_return(expected_archive + '\n')
+
+    assert (
+        module.resolve_archive_name(
+            'repo',
+            'latest',
+            config={},
+            local_borg_version='1.2.3',
+            global_arguments=argparse.Namespace(log_json=False),
+        )
+        == expected_archive
+    )
+
+
+def test_resolve_archive_name_with_borg_environment_skips_making_environment():
+    expected_archive = 'archive-name'
+    flexmock(module.environment).should_receive('make_environment').never()
+    flexmock(module).should_receive('execute_command_and_capture_output').with_args(
+        ('borg', 'list') + BORG_LIST_LATEST_ARGUMENTS,
+        extra_environment={'BORG_PASSPHRASE': 'secret'},
+        borg_local_path='borg',
+    ).and_return(expected_archive + '\n')
+
+    assert (
+        module.resolve_archive_name(
+            'repo',
+            'latest',
+            config={},
+            local_borg_version='1.2.3',
+            global_arguments=argparse.Namespace(log_json=False),
+            borg_environment={'BORG_PASSPHRASE': 'secret'},
+        )
+        == expected_archive
+    )
+
+
+def test_resolve_archive_names_passes_through_non_latest_archive_name():
+    archive = 'myhost-2030-01-01T14:41:17.647620'
+    flexmock(module).should_receive('resolve_archive_name').never()
+
+    assert module.resolve_archive_names(
+        ('repo', 'other'),
+        archive,
+        config={},
+        local_borg_version='1.2.3',
+        global_arguments=argparse.Namespace(log_json=False),
+    ) == {'repo': archive, 'other': archive}
+
+
+def test_resolve_archive_names_resolves_latest_archive_for_each_repository_concurrently():
+    global_arguments = argparse.Namespace(log_json=False)
+    borg_environment = {'BORG_PASSPHRASE': 'secret'}
+    flexmock(module.environment).should_receive('make_environment').and_return(
+        borg_environment
+    ).once()
+    flexmock(module.sys.stdin).should_receive('isatty').and_return(False)
+    executor = module.concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    flexmock(module.concurrent.futures).should_receive('ThreadPoolExecutor').with_args(
+        max_workers=2
+    ).and_return(executor).once()
+    for repository_path, archive_name in (('repo', 'archive-one'), ('other', 'archive-two')):
+        flexmock(module).should_receive('resolve_archive_name').with_args(
+            repository_path,
+            archive='latest',
+            config={},
+            local_borg_version='1.2.3',
+            global_arguments=global_arguments,
+            local_path='borg',
+            remote_path=None,
+            borg_environment=borg_environment,
+        ).and_return(archive_name).once()
+
+    assert module.resolve_archive_names(
+        ('repo', 'other'),
+        'latest',
+        config={},
+        local_borg_version='1.2.3',
+        global_arguments=global_arguments,
+    ) == {'repo': 'archive-one', 'other': 'archive-two'}
+
+
+def test_resolve_archive_names_with_borg_environment_skips_making_environment():
+    global_arguments = argparse.Namespace(log_json=False)
+    borg_environment = {'BORG_PASSPHRASE': 'secret'}
+    flexmock(module.environment).should_receive('make_environment').never()
+    flexmock(module.sys.stdin).should_receive('isatty').and_return(False)
+    for repository_path, archive_name in (('repo', 'archive-one'), ('other', 'archive-two')):
+        flexmock(module).should_receive('resolve_archive_name').with_args(
+            repository_path,
+            archive='latest',
+            config={},
+            local_borg_version='1.2.3',
+            global_arguments=global_arguments,
+            local_path='borg',
+            remote_path=None,
+            borg_environment=borg_environment,
+        ).and_return(archive_name).once()
+
+    assert module.resolve_archive_names(
+        ('repo', 'other'),
+        'latest',
+        config={},
+        local_borg_version='1.2.3',
+        global_arguments=global_arguments,
+        borg_environment=borg_environment,
+    ) == {'repo': 'archive-one', 'other': 'archive-two'}
+
+
+def test_resolve_archive_names_with_stdin_tty_resolves_serially():
+    global_arguments = argparse.Namespace(log_json=False)
+    borg_environment = {'BORG_PASSPHRASE': 'secret'}
+    flexmock(module.sys.stdin).should_receive('isatty').and_return(True)
+    flexmock(module.concurrent.futures).should_receive('ThreadPoolExecutor').never()
+    for repository_path, archive_name in (('repo', 'archive-one'), ('other', 'archive-two')):
+        flexmock(module).should_receive('resolve_archive_name').with_args(
+            repository_path,
+            archive='latest',
+            config={},
+            local_borg_version='1.2.3',
+            global_arguments=global_arguments,
+            local_path='borg',
+            remote_path=None,
+            borg_environment=borg_environment,
+        ).and_return(archive_name).once()
+
+    assert module.resolve_archive_names(
+        ('repo', 'other'),
+        'latest',
+        config={},
+        local_borg_version='1.2.3',
+        global_arguments=global_arguments,
+        borg_environment=borg_environment,
+    ) == {'repo': 'archive-one', 'other': 'archive-two'}
+
+
+def test_resolve_archive_names_without_passphrase_in_borg_environment_resolves_serially():
+    global_arguments = argparse.Namespace(log_json=False)
+    borg_environment = {'BORG_RSH': 'ssh -i key'}
+    flexmock(module.sys.stdin).should_receive('isatty').and_return(False)
+    flexmock(module.concurrent.futures).should_receive('ThreadPoolExecutor').never()
+    for repository_path, archive_name in (('repo', 'archive-one'), ('other', 'archive-two')):
+        flexmock(module).should_receive('resolve_archive_name').with_args(
+            repository_path,
+            archive='latest',
+            config={},
+            local_borg_version='1.2.3',
+            global_arguments=global_arguments,
+            local_path='borg',
+            remote_path=None,
+            borg_environment=borg_environment,
+        ).and_return(archive_name).once()
+
+    assert module.resolve_archive_names(
+        ('repo', 'other'),
+        'latest',
+        config={},
+        local_borg_version='1.2.3',
+        global_arguments=global_arguments,
+        borg_environment=borg_environment,
+    ) == {'repo': 'archive-one', 'other': 'archive-two'}
+
+
+def test_resolve_archive_names_without_repositories_returns_empty_dict():
+    flexmock(module).should_receive('resolve_archive_name').never()
+
+    assert (
+        module.resolve_archive_names(
+            (),
+            'latest',
+            config={},
+            local_borg_version='1.2.3',
+            global_arguments=argparse.Namespace(log_json=False),
+        )
+        == {}
+    )
+
+
+def test_resolve_archive_names_with_error_resolving_archive_raises():
+    flexmock(module).should_receive('resolve_archive_name').and_raise(ValueError)
+
+    with pytest.raises(ValueError):
+        module.resolve_archive_names(
+            ('repo',),
+            'latest',
+            config={},
+            local_borg_version='1.2.3',
+            global_arguments=argparse.Namespace(log_json=False),
+        )
+
+
 def test_make_rlist_command_includes_log_info():
     insert_logging_mock(logging.INFO)
     flexmock(module.flags).should_receive('make_flags').and_return(())
@@ -215,10 +474,10 @@ def test_make_rlist_command_includes_log_info():
         repository_path='repo',
         config={},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None, paths=None, json=False, prefix=None, match_archives=None
         ),
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
     )
 
     assert command == ('borg', 'list', '--info', 'repo')
@@ -237,10 +496,10 @@ def test_make_rlist_command_includes_json_but_not_info():
         repository_path='repo',
         config={},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None, paths=None, json=True, prefix=None, match_archives=None
         ),
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
     )
 
     assert command == ('borg', 'list', '--json', 'repo')
@@ -259,10 +518,10 @@ def test_make_rlist_command_includes_log_debug():
         repository_path='repo',
         config={},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None, paths=None, json=False, prefix=None, match_archives=None
         ),
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
     )
 
     assert command == ('borg', 'list', '--debug', '--show-rc', 'repo')
@@ -281,10 +540,10 @@ def test_make_rlist_command_includes_json_but_not_debug():
         repository_path='repo',
         config={},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None, paths=None, json=True, prefix=None, match_archives=None
         ),
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
     )
 
     assert command == ('borg', 'list', '--json', 'repo')
@@ -302,10 +561,10 @@ def test_make_rlist_command_includes_json():
         repository_path='repo',
         config={},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None, paths=None, json=True, prefix=None, match_archives=None
         ),
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
     )
 
     assert command == ('borg', 'list', '--json', 'repo')
@@ -325,10 +584,10 @@ def test_make_rlist_command_includes_log_json():
         repository_path='repo',
         config={},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None, paths=None, json=False, prefix=None, match_archives=None
         ),
-        global_arguments=flexmock(log_json=True),
+        global_arguments=argparse.Namespace(log_json=True),
     )
 
     assert command == ('borg', 'list', '--log-json', 'repo')
@@ -348,10 +607,10 @@ def test_make_rlist_command_includes_lock_wait():
         repository_path='repo',
         config={'lock_wait': 5},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None, paths=None, json=False, prefix=None, match_archives=None
         ),
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
     )
 
     assert command == ('borg', 'list', '--lock-wait', '5', 'repo')
@@ -369,10 +628,10 @@ def test_make_rlist_command_includes_local_path():
         repository_path='repo',
         config={},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None, paths=None, json=False, prefix=None, match_archives=None
         ),
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
         local_path='borg2',
     )
 
@@ -393,10 +652,10 @@ def test_make_rlist_command_includes_remote_path():
         repository_path='repo',
         config={},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None, paths=None, json=False, prefix=None, match_archives=None
         ),
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
         remote_path='borg2',
     )
 
@@ -417,8 +676,8 @@ def test_make_rlist_command_transforms_prefix_into_match_archives():
         repository_path='repo',
         config={},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(archive=None, paths=None, json=False, prefix='foo'),
-        global_arguments=flexmock(log_json=False),
+        rlist_arguments=argparse.Namespace(archive=None, paths=None, json=False, prefix='foo'),
+        global_arguments=argparse.Namespace(log_json=False),
     )
 
     assert command == ('borg', 'list', '--match-archives', 'sh:foo*', 'repo')
@@ -436,8 +695,8 @@ def test_make_rlist_command_prefers_prefix_over_archive_name_format():
         repository_path='repo',
         config={'archive_name_format': 'bar-{now}'},  # noqa: FS003
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(archive=None, paths=None, json=False, prefix='foo'),
-        global_arguments=flexmock(log_json=False),
+        rlist_arguments=argparse.Namespace(archive=None, paths=None, json=False, prefix='foo'),
+        global_arguments=argparse.Namespace(log_json=False),
     )
 
     assert command == ('borg', 'list', '--match-archives', 'sh:foo*', 'repo')
@@ -455,10 +714,10 @@ def test_make_rlist_command_transforms_archive_name_format_into_match_archives()
         repository_path='repo',
         config={'archive_name_format': 'bar-{now}'},  # noqa: FS003
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None, paths=None, json=False, prefix=None, match_archives=None
         ),
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
     )
 
     assert command == ('borg', 'list', '--match-archives', 'sh:bar-*', 'repo')
@@ -476,10 +735,10 @@ def test_make_rlist_command_includes_short():
         repository_path='repo',
         config={},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None, paths=None, json=False, prefix=None, match_archives=None, short=True
         ),
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
     )
 
     assert command == ('borg', 'list', '--short', 'repo')
@@ -511,7 +770,7 @@ def test_make_rlist_command_includes_additional_flags(argument_name):
         repository_path='repo',
         config={},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None,
             paths=None,
             json=False,
@@ -521,7 +780,7 @@ def test_make_rlist_command_includes_additional_flags(argument_name):
             format=None,
             **{argument_name: 'value'},
         ),
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
     )
 
     assert command == ('borg', 'list', '--' + argument_name.replace('_', '-'), 'value', 'repo')
@@ -544,7 +803,7 @@ def test_make_rlist_command_with_match_archives_calls_borg_with_match_archives_f
         repository_path='repo',
         config={},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None,
             paths=None,
             json=False,
@@ -553,7 +812,7 @@ def test_make_rlist_command_with_match_archives_calls_borg_with_match_archives_f
             find_paths=None,
             format=None,
         ),
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
     )
 
     assert command == ('borg', 'list', '--match-archives', 'foo-*', 'repo')
@@ -561,6 +820,7 @@ def test_make_rlist_command_with_match_archives_calls_borg_with_match_archives_f
 
 def test_list_repository_calls_two_commands():
     flexmock(module.borgmatic.logger).should_receive('add_custom_log_levels')
+    flexmock(module.logging).ANSWER = module.borgmatic.logger.ANSWER
     flexmock(module).should_receive('make_rlist_command')
     flexmock(module.environment).should_receive('make_environment')
     flexmock(module).should_receive('execute_command_and_capture_output').once()
@@ -576,6 +836,33 @@ def test_list_repository_calls_two_commands():
     )
 
 
+def test_list_repository_with_borg_environment_skips_making_environment():
+    flexmock(module.borgmatic.logger).should_receive('add_custom_log_levels')
+    flexmock(module.logging).ANSWER = module.borgmatic.logger.ANSWER
+    flexmock(module).should_receive('make_rlist_command')
+    flexmock(module.environment).should_receive('make_environment').never()
+    borg_environment = {'BORG_PASSPHRASE': 'secret'}
+    flexmock(module).should_receive('execute_command_and_capture_output').with_args(
+        None, extra_environment=borg_environment, borg_local_path='borg'
+    ).once()
+    flexmock(module.flags).should_receive('warn_for_aggressive_archive_flags')
+    flexmock(module).should_receive('execute_command').with_args(
+        None,
+        output_log_level=module.borgmatic.logger.ANSWER,
+        borg_local_path='borg',
+        extra_environment=borg_environment,
+    ).once()
+
+    module.list_repository(
+        repository_path='repo',
+        config={},
+        local_borg_version='1.2.3',
+        rlist_arguments=argparse.Namespace(json=False),
+        global_arguments=flexmock(),
+        borg_environment=borg_environment,
+    )
+
+
 def test_list_repository_with_json_calls_json_command_only():
     flexmock(module.borgmatic.logger).should_receive('add_custom_log_levels')
     flexmock(module).should_receive('make_rlist_command')
@@ -611,7 +898,7 @@ def test_make_rlist_command_with_date_based_matching_calls_borg_with_date_based_
         repository_path='repo',
         config={},
         local_borg_version='1.2.3',
-        rlist_arguments=flexmock(
+        rlist_arguments=argparse.Namespace(
             archive=None,
             paths=None,
             json=False,
@@ -622,7 +909,7 @@ def test_make_rlist_command_with_date_based_matching_calls_borg_with_date_based_
             older='1m',
             oldest='1w',
         ),
-        global_arguments=flexmock(log_json=False),
+        global_arguments=argparse.Namespace(log_json=False),
     )
 
     assert command == (
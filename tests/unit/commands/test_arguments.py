@@ -153,6 +153,14 @@ def test_parse_and_record_action_arguments_with_borg_action_consumes_arguments_a
             ),
             (),
         ),
+        # Duplicate flags remaining, yielding each only once in order of first appearance.
+        (
+            (
+                ('--test-flag', '--other-flag', '--test-flag'),
+                ('--other-flag', '--test-flag'),
+            ),
+            ('--test-flag', '--other-flag'),
+        ),
         # No flags.
         ((), ()),
     ],
@@ -207,7 +215,7 @@ def test_parse_arguments_for_actions_consumes_action_arguments_with_alias():
     global_namespace = flexmock(config_paths=[])
     global_parser = flexmock()
     global_parser.should_receive('parse_known_args').and_return((global_namespace, ()))
-    flexmock(module).ACTION_ALIASES = {'action': ['-a'], 'other': ['-o']}
+    flexmock(module).ALIAS_TO_ACTION_NAME = {'-a': 'action', '-o': 'other'}
 
     arguments, remaining_action_arguments = module.parse_arguments_for_actions(
         ('-a', '--foo', 'true'), action_parsers, global_parser
@@ -417,6 +425,57 @@ def test_parse_arguments_for_actions_with_borg_action_skips_other_action_parsers
     assert remaining_action_arguments == ((), ())
 
 
+def test_parse_arguments_for_actions_parses_repeated_action_name_only_once():
+    action_namespace = flexmock(foo=True)
+    remaining = flexmock()
+    flexmock(module).should_receive('get_subaction_parsers').and_return({})
+    flexmock(module).should_receive('parse_and_record_action_arguments').replace_with(
+        lambda unparsed, parsed, parser, action, canonical=None: parsed.update(
+            {action: action_namespace}
+        )
+        or remaining
+    ).once()
+    flexmock(module).should_receive('get_subactions_for_actions').and_return({})
+    action_parsers = {'action': flexmock()}
+    global_namespace = flexmock(config_paths=[])
+    global_parser = flexmock()
+    global_parser.should_receive('parse_known_args').and_return((global_namespace, ()))
+
+    arguments, remaining_action_arguments = module.parse_arguments_for_actions(
+        ('action', '--foo', 'action'), action_parsers, global_parser
+    )
+
+    assert arguments == {'global': global_namespace, 'action': action_namespace}
+    assert remaining_action_arguments == (remaining, ())
+
+
+def test_parse_arguments_for_actions_skips_parsing_subactions_absent_from_arguments():
+    subaction_namespace = flexmock()
+    flexmock(module).should_receive('get_subaction_parsers').and_return(
+        {'bootstrap': flexmock(), 'generate': flexmock()}
+    )
+    flexmock(module).should_receive('parse_and_record_action_arguments').with_args(
+        ('config', 'generate'), object, object, 'generate'
+    ).replace_with(
+        lambda unparsed, parsed, parser, action, canonical=None: parsed.update(
+            {action: subaction_namespace}
+        )
+        or ('config',)
+    ).once()
+    flexmock(module).should_receive('get_subactions_for_actions').and_return({})
+    action_parsers = {'config': flexmock()}
+    global_namespace = flexmock(config_paths=[])
+    global_parser = flexmock()
+    global_parser.should_receive('parse_known_args').and_return((global_namespace, ()))
+
+    arguments, remaining_action_arguments = module.parse_arguments_for_actions(
+        ('config', 'generate'), action_parsers, global_parser
+    )
+
+    assert arguments == {'global': global_namespace, 'generate': subaction_namespace}
+    assert remaining_action_arguments == ((), ())
+
+
 def test_parse_arguments_for_actions_raises_error_when_no_action_is_specified():
     flexmock(module).should_receive('get_subaction_parsers').and_return({'bootstrap': [flexmock()]})
     flexmock(module).should_receive('parse_and_record_action_arguments').and_return(flexmock())
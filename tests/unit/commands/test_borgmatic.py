@@ -261,6 +261,22 @@ def test_run_configuration_retries_hard_error():
     assert results == error_logs
 
 
+def test_run_configuration_with_actions_error_clears_latest_archive_cache_before_each_retry():
+    flexmock(module).should_receive('verbosity_to_log_level').and_return(logging.INFO)
+    flexmock(module.borg_version).should_receive('local_borg_version').and_return(flexmock())
+    flexmock(module.command).should_receive('execute_hook')
+    flexmock(module).should_receive('run_actions').and_raise(OSError).times(2)
+    flexmock(borgmatic.borg.rlist._fetch_latest_archive).should_receive('cache_clear').times(2)
+    error_logs = [flexmock()]
+    flexmock(module).should_receive('log_error_records').and_return(error_logs)
+    config = {'repositories': [{'path': 'foo'}], 'retries': 1}
+    arguments = {'global': flexmock(monitoring_verbosity=1, dry_run=False), 'create': flexmock()}
+
+    results = list(module.run_configuration('test.yaml', config, arguments))
+
+    assert results == error_logs
+
+
 def test_run_configuration_repos_ordered():
     flexmock(module).should_receive('verbosity_to_log_level').and_return(logging.INFO)
     flexmock(module.borg_version).should_receive('local_borg_version').and_return(flexmock())
@@ -514,6 +530,64 @@ def test_run_actions_runs_create():
     assert result == (expected,)
 
 
+def test_run_actions_with_archive_modifying_action_clears_latest_archive_cache():
+    flexmock(module).should_receive('add_custom_log_levels')
+    flexmock(module.command).should_receive('execute_hook')
+    flexmock(borgmatic.actions.create).should_receive('run_create').and_yield(flexmock())
+    flexmock(borgmatic.borg.rlist._fetch_latest_archive).should_receive('cache_clear').once()
+
+    tuple(
+        module.run_actions(
+            arguments={'global': flexmock(dry_run=False, log_file='foo'), 'create': flexmock()},
+            config_filename=flexmock(),
+            config={'repositories': []},
+            local_path=flexmock(),
+            remote_path=flexmock(),
+            local_borg_version=flexmock(),
+            repository={'path': 'repo'},
+        )
+    )
+
+
+def test_run_actions_with_check_action_clears_latest_archive_cache():
+    flexmock(module).should_receive('add_custom_log_levels')
+    flexmock(module.command).should_receive('execute_hook')
+    flexmock(module.checks).should_receive('repository_enabled_for_checks').and_return(True)
+    flexmock(borgmatic.actions.check).should_receive('run_check')
+    flexmock(borgmatic.borg.rlist._fetch_latest_archive).should_receive('cache_clear').once()
+
+    tuple(
+        module.run_actions(
+            arguments={'global': flexmock(dry_run=False, log_file='foo'), 'check': flexmock()},
+            config_filename=flexmock(),
+            config={'repositories': []},
+            local_path=flexmock(),
+            remote_path=flexmock(),
+            local_borg_version=flexmock(),
+            repository={'path': 'repo'},
+        )
+    )
+
+
+def test_run_actions_with_read_only_action_does_not_clear_latest_archive_cache():
+    flexmock(module).should_receive('add_custom_log_levels')
+    flexmock(module.command).should_receive('execute_hook')
+    flexmock(borgmatic.actions.info).should_receive('run_info').and_yield(flexmock())
+    flexmock(borgmatic.borg.rlist._fetch_latest_archive).should_receive('cache_clear').never()
+
+    tuple(
+        module.run_actions(
+            arguments={'global': flexmock(dry_run=False, log_file='foo'), 'info': flexmock()},
+            config_filename=flexmock(),
+            config={'repositories': []},
+            local_path=flexmock(),
+            remote_path=flexmock(),
+            local_borg_version=flexmock(),
+            repository={'path': 'repo'},
+        )
+    )
+
+
 def test_run_actions_with_skip_actions_skips_create():
     flexmock(module).should_receive('add_custom_log_levels')
     flexmock(module.command).should_receive('execute_hook')
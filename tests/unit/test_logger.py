@@ -177,6 +177,7 @@ def test_add_logging_level_skips_global_setting_if_already_set():
 def test_configure_logging_with_syslog_log_level_probes_for_log_socket_on_linux():
     flexmock(module).should_receive('add_custom_log_levels')
     flexmock(module.logging).ANSWER = module.ANSWER
+    flexmock(module.logging).DISABLED = module.DISABLED
     flexmock(module).should_receive('Multi_stream_handler').and_return(
         flexmock(
             setFormatter=lambda formatter: None, setLevel=lambda level: None, level=logging.INFO
@@ -199,6 +200,7 @@ def test_configure_logging_with_syslog_log_level_probes_for_log_socket_on_linux(
 def test_configure_logging_with_syslog_log_level_probes_for_log_socket_on_macos():
     flexmock(module).should_receive('add_custom_log_levels')
     flexmock(module.logging).ANSWER = module.ANSWER
+    flexmock(module.logging).DISABLED = module.DISABLED
     flexmock(module).should_receive('Multi_stream_handler').and_return(
         flexmock(
             setFormatter=lambda formatter: None, setLevel=lambda level: None, level=logging.INFO
@@ -222,6 +224,7 @@ def test_configure_logging_with_syslog_log_level_probes_for_log_socket_on_macos(
 def test_configure_logging_with_syslog_log_level_probes_for_log_socket_on_freebsd():
     flexmock(module).should_receive('add_custom_log_levels')
     flexmock(module.logging).ANSWER = module.ANSWER
+    flexmock(module.logging).DISABLED = module.DISABLED
     flexmock(module).should_receive('Multi_stream_handler').and_return(
         flexmock(
             setFormatter=lambda formatter: None, setLevel=lambda level: None, level=logging.INFO
@@ -246,6 +249,7 @@ def test_configure_logging_with_syslog_log_level_probes_for_log_socket_on_freebs
 def test_configure_logging_without_syslog_log_level_skips_syslog():
     flexmock(module).should_receive('add_custom_log_levels')
     flexmock(module.logging).ANSWER = module.ANSWER
+    flexmock(module.logging).DISABLED = module.DISABLED
     flexmock(module).should_receive('Multi_stream_handler').and_return(
         flexmock(
             setFormatter=lambda formatter: None, setLevel=lambda level: None, level=logging.INFO
@@ -264,6 +268,7 @@ def test_configure_logging_without_syslog_log_level_skips_syslog():
 def test_configure_logging_skips_syslog_if_not_found():
     flexmock(module).should_receive('add_custom_log_levels')
     flexmock(module.logging).ANSWER = module.ANSWER
+    flexmock(module.logging).DISABLED = module.DISABLED
     flexmock(module).should_receive('Multi_stream_handler').and_return(
         flexmock(
             setFormatter=lambda formatter: None, setLevel=lambda level: None, level=logging.INFO